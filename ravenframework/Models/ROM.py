@@ -127,6 +127,7 @@ class ROM(Dummy):
     self.seed = None # seed information
     self._segmentROM = None # segment rom instance
     self._paramInput = None # the parsed xml input
+    self._sourcePath = None # serialized file this ROM was loaded from, if any; enables transport-by-path
 
     # for Clustered ROM
     self.addAssemblerObject('Classifier', InputData.Quantity.zero_to_one)
@@ -175,6 +176,9 @@ class ROM(Dummy):
       @ In, d, dict, things to unserialize
       @ Out, None
     """
+    # transport-by-path (see __reduce_ex__) ships only the entity-level settings; they
+    # must be pushed down into the reloaded engines, not just onto this entity
+    resyncParams = d.pop('_resyncParams', False)
     # default setstate behavior
     self.__dict__.update(d)
     if not d['amITrained']:
@@ -183,6 +187,50 @@ class ROM(Dummy):
       self.supervisedContainer  = [modelInstance]
     # since we pop this out during saving state, initialize it here
     self.assemblerDict = {}
+    if resyncParams:
+      # mirror what _copyModel applies after an IOStep load (reseeding, Multicycle,
+      # clusterEvalMode, ...), so a worker-side reload evaluates like the original
+      self.setAdditionalParams({'seed': self.seed, 'paramInput': self._paramInput})
+
+  def __reduce_ex__(self, protocol):
+    """
+      Customizes pickling for cross-process transport.  Once this ROM is known to live
+      in a serialized file, shipping it to a worker pickles only the file path plus the
+      lightweight settings layered on top of the load; the worker reloads the payload
+      from disk (through a per-process cache, so ROMs sharing a file are deserialized
+      once per worker) instead of receiving a full in-band copy per worker.  File
+      persistence paths (IOStep pickling, serialize, FMU export) suspend this so the
+      files they write stay self-contained.  ROMs with no known source file pickle
+      normally.
+      @ In, protocol, int, requested pickle protocol
+      @ Out, __reduce_ex__, tuple, pickle reduction tuple
+    """
+    sourcePath = getattr(self, '_sourcePath', None)
+    if sourcePath is not None:
+      from ..SupervisedLearning.pickledROM import _rehydrateFromPath
+      # resync the light entity-specific settings on top of the reloaded payload; the
+      # _resyncParams marker makes __setstate__ push them into the engines as well
+      state = {'name': self.name, 'amITrained': self.amITrained, 'seed': self.seed,
+               '_paramInput': self._paramInput, '_sourcePath': sourcePath,
+               '_resyncParams': True}
+      return (_rehydrateFromPath, (sourcePath,), state)
+    return super().__reduce_ex__(protocol)
+
+  def serialize(self, fileObjIn, **kwargs):
+    """
+      This method is aimed to serialize the model (and derived) instances.  Specialized
+      here to suspend transport-by-path (see __reduce_ex__) for the duration, since a
+      serialized file must carry the full payload rather than a pointer to another file.
+      @ In, fileObjIn, str or File object, the filename of the output serialized binary file or the RAVEN File instance
+      @ In, kwargs, dict, dictionary of options that the derived class might require
+      @ Out, None
+    """
+    sourcePath = self._sourcePath
+    self._sourcePath = None
+    try:
+      super().serialize(fileObjIn, **kwargs)
+    finally:
+      self._sourcePath = sourcePath
 
   def applyRunInfo(self, runInfo):
     """
@@ -340,6 +388,8 @@ class ROM(Dummy):
     self.train(obj)
     self.setAdditionalParams(loadSettings)
     self.pickled = False
+    # inherit the source file, if known, so this ROM can transport by path (__reduce_ex__)
+    self._sourcePath = getattr(obj, '_sourcePath', None)
 
   def train(self,trainingSet):
     """
@@ -697,7 +747,8 @@ class ravenROM(ExternalGreyBoxModel):
     self._rom_file = os.path.abspath(self._rom_file)
     if not os.path.exists(self._rom_file):
       raise IOError('The serialized (binary) file has not been found in location "' + str(self._rom_file)+'" !')
-    self.rom = pickle.load(open(self._rom_file, mode='rb'))
+    from ravenframework.SupervisedLearning.pickledROM import pickledROM
+    self.rom = pickledROM.loadFromFile(self._rom_file)
     #
     self.settings = self.rom.getInitParams()
     # get input names
@@ -48,7 +48,8 @@ class ROMLoader(object):
     serializedROMlocation = os.path.abspath(binaryFileName)
     if not os.path.exists(serializedROMlocation):
       raise IOError('The serialized (binary) file has not been found in location "' + str(serializedROMlocation)+'" !')
-    self.rom = pickle.load(open(serializedROMlocation, mode='rb'))
+    from ravenframework.SupervisedLearning.pickledROM import pickledROM
+    self.rom = pickledROM.loadFromFile(serializedROMlocation)
 
   def __getstate__(self):
     """
@@ -28,6 +28,7 @@ import cloudpickle
 # Internal Modules----------------------------------------------------------------------------------
 from .. import Files
 from .. import Models
+from ..SupervisedLearning.pickledROM import pickledROM, save as savePickledROM
 from .Step import Step
 from ..OutStreams import OutStreamEntity
 from ..DataObjects import DataObject
@@ -204,10 +205,15 @@ class IOStep(Step):
         if isinstance(inDictionary['Input'][i],Models.ROM) and not inDictionary['Input'][i].amITrained:
           self.raiseAnError(RuntimeError, f'Pickled rom "{inDictionary["Input"][i].name}" was not trained!  Train it before pickling and unpickling using a RomTrainer step.')
         fileobj = outputs[i]
-        fileobj.open(mode='wb+')
-        cloudpickle.dump(inDictionary['Input'][i], fileobj, protocol=pickle.HIGHEST_PROTOCOL)
-        fileobj.flush()
-        fileobj.close()
+        if isinstance(inDictionary['Input'][i], Models.ROM):
+          # ROMs go through the optimized writer (stripped memo, lazy sub-ROM
+          # collections); the output stays a self-contained plain-pickle file
+          savePickledROM(fileobj.getAbsFile(), inDictionary['Input'][i])
+        else:
+          fileobj.open(mode='wb+')
+          cloudpickle.dump(inDictionary['Input'][i], fileobj, protocol=pickle.HIGHEST_PROTOCOL)
+          fileobj.flush()
+          fileobj.close()
 
       elif self.actionType[i] == 'MODEL-PYOMO':
         outfile = open(outputs[i].getAbsFile(),"w")
@@ -228,7 +234,7 @@ class IOStep(Step):
         # inDictionary['Input'][i] is a Files, outputs[i] is ROM or ExternalModel
         # unpickle the ROM
         fileobj = inDictionary['Input'][i]
-        unpickledObj = pickle.load(open(fileobj.getAbsFile(),'rb+'))
+        unpickledObj = pickledROM.loadFromFile(fileobj.getAbsFile())
         if not isinstance(unpickledObj, (Models.ROM, Models.ExternalModel)):
           # DEBUGG
           # the following will iteratively check the size of objects being unpickled
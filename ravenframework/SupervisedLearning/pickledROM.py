@@ -18,13 +18,505 @@
   Originally from SupervisedLearning.py, split in PR #650 in July 2018
   Specific ROM implementation for pickledROM
 """
+#External Modules------------------------------------------------------------------------------------
+import gc
+import io
+import os
+import copy
+import copyreg
+import functools
+import importlib
+import mmap
+import pickle
+import pickletools
+import queue
+import threading
+#External Modules End--------------------------------------------------------------------------------
+
+#Internal Modules------------------------------------------------------------------------------------
 from .SupervisedLearning import SupervisedLearning
 from ..utils import InputTypes, InputData
+#Internal Modules End--------------------------------------------------------------------------------
+
+# input-spec pieces that do not depend on the class, built once per process (see also
+# the class-level spec cache in getInputSpecification)
+_GROWTH_ENUM = InputTypes.makeEnumType('growth', 'armaGrowthType', ['exponential', 'linear'])
+_CLUSTER_EVAL_ENUM = InputTypes.makeEnumType('clusterEvalModeEnum', 'clusterEvalModeType', ['clustered', 'truncated', 'full'])
+
+def _buildMulticycleSpec():
+  """
+    Builds a fresh \\xmlNode{Multicycle} specification subtree, including the growth
+    sub-specification, for use in getInputSpecification.
+    @ In, None
+    @ Out, multicycle, InputData.ParameterInput, the Multicycle specification
+  """
+  multicycle = InputData.parameterInputFactory("Multicycle", contentType=InputTypes.StringType,
+                                               descr=r"""indicates that each sample of the ARMA should yield
+                                                 multiple sequential samples. For example, if an ARMA model is trained to produce a year's worth of data,
+                                                 enabling \xmlNode{Multicycle} causes it to produce several successive years of data. Multicycle sampling
+                                                 is independent of ROM training, and only changes how samples of the ARMA are created.
+                                                 \nb The output of a multicycle ARMA must be stored in a \xmlNode{DataSet}, as the targets will depend
+                                                 on both the \xmlNode{pivotParameter} as well as the cycle, \xmlString{Cycle}. The cycle is a second
+                                                 \xmlNode{Index} that all targets should depend on, with variable name \xmlString{Cycle}.""", default=None)
+  multicycle.addSub(InputData.parameterInputFactory("cycles", contentType=InputTypes.IntegerType,
+                                               descr=r"""the number of cycles the ARMA should produce
+                                                 each time it yields a sample.""", default='no-default'))
+  growth = InputData.parameterInputFactory("growth", contentType=InputTypes.FloatType,
+                                               descr=r"""if provided then the histories produced by
+                                                 the ARMA will be increased by the growth factor for successive cycles. This node can be added
+                                                 multiple times with different settings for different targets.
+                                                 The text of this node is the growth factor in percentage. Some examples are in
+                                                 Table~\ref{tab:arma multicycle growth}, where \emph{Growth factor} is the value used in the RAVEN
+                                                 input and \emph{Scaling factor} is the value by which the history will be multiplied.
+                                                 \begin{table}[h!]
+                                                   \centering
+                                                   \begin{tabular}{r c l}
+                                                     Growth factor & Scaling factor & Description \\ \hline
+                                                     50 & 1.5 & growing by 50\% each cycle \\
+                                                     -50 & 0.5 & shrinking by 50\% each cycle \\
+                                                     150 & 2.5 & growing by 150\% each cycle \\
+                                                   \end{tabular}
+                                                   \caption{ARMA Growth Factor Examples}
+                                                   \label{tab:arma multicycle growth}
+                                                 \end{table}""", default=None)
+  growth.addParam("targets", InputTypes.StringListType, required=True,
+                descr=r"""lists the targets
+                  in this ARMA that this growth factor should apply to.""")
+  growth.addParam('start_index', InputTypes.IntegerType)
+  growth.addParam('end_index', InputTypes.IntegerType)
+  growth.addParam("mode", _GROWTH_ENUM, required=True,
+                descr=r"""either \xmlString{linear} or
+                  \xmlString{exponential}, determines the manner in which the growth factor is applied.
+                  If \xmlString{linear}, then the scaling factor is $(1+y\cdot g/100)$;
+                  if \xmlString{exponential}, then the scaling factor is $(1+g/100)^y$;
+                  where $y$ is the cycle after the first and $g$ is the provided scaling factor.""")
+  multicycle.addSub(growth)
+  return multicycle
+
+# buffers smaller than this stay in the pickle stream; only genuinely large arrays are
+# worth routing through the out-of-band sidecar
+_BUFFER_INLINE_THRESHOLD = 1 << 20
+
+def _sidecarPath(path):
+  """
+    Provides the name of the out-of-band buffer file associated with a serialized ROM.
+    @ In, path, str, path to the serialized ROM file
+    @ Out, _sidecarPath, str, path to the companion buffer file
+  """
+  return path + '.buf'
+
+def _iterBuffers(sidecarPath):
+  """
+    Generator yielding the out-of-band buffers stored in a sidecar file, in the order
+    they were written by "save".  The sidecar is memory-mapped so each buffer is a
+    zero-copy view into the file rather than a heap copy of the array bytes.  The map
+    is copy-on-write (ACCESS_COPY): arrays reconstructed over these views stay writable
+    like ordinarily-unpickled arrays, without any in-place edit reaching the file.
+    @ In, sidecarPath, str, path to the companion buffer file
+    @ Out, _iterBuffers, generator, yields pickle.PickleBuffer views for the unpickler
+  """
+  with open(sidecarPath, 'rb') as side:
+    mapped = mmap.mmap(side.fileno(), 0, access=mmap.ACCESS_COPY)
+  view = memoryview(mapped)
+  offset = 0
+  total = len(view)
+  while offset < total:
+    size = int.from_bytes(view[offset:offset + 8], 'little')
+    offset += 8
+    yield pickle.PickleBuffer(view[offset:offset + size])
+    offset += size
+
+class _PrefetchReader:
+  """
+    Minimal file-like reader that overlaps disk I/O with deserialization.  A background
+    thread issues large sequential unbuffered reads into a bounded queue; the consumer
+    (the C unpickler, which releases the GIL around its read calls) drains the queue, so
+    the next chunk is usually already in memory by the time it is requested.  Only the
+    read/readline interface the unpickler needs is provided.
+  """
+  _CHUNKSIZE = 4 << 20 # size of each read-ahead request
+  _DEPTH = 4           # chunks the reader thread may run ahead of the consumer
+
+  def __init__(self, path):
+    """
+      Constructor; opens the file and starts the read-ahead thread.
+      @ In, path, str, path of the file to read
+      @ Out, None
+    """
+    self._file = open(path, 'rb', buffering=0)
+    self._queue = queue.Queue(maxsize=self._DEPTH)
+    self._pending = bytearray()
+    self._eof = False
+    self._error = None # disk error hit by the reader thread, re-raised on the consumer side
+    self._stop = threading.Event()
+    self._thread = threading.Thread(target=self._readAhead, daemon=True)
+    self._thread.start()
+
+  def _readAhead(self):
+    """
+      Body of the read-ahead thread; streams the file into the queue, ending with an
+      empty chunk as the end-of-file marker.  Stops promptly when close() signals, and
+      records any disk error for the consumer to re-raise.
+      @ In, None
+      @ Out, None
+    """
+    try:
+      if hasattr(os, 'posix_fadvise'):
+        os.posix_fadvise(self._file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except OSError:
+      pass
+    try:
+      while not self._stop.is_set():
+        chunk = self._file.read(self._CHUNKSIZE)
+        if not self._put(chunk) or not chunk:
+          return
+    except OSError as err:
+      self._error = err
+      self._put(b'')
+
+  def _put(self, chunk):
+    """
+      Hands a chunk to the consumer, backing off whenever the queue is full so a stop
+      signal is never missed while blocked.
+      @ In, chunk, bytes, chunk to enqueue (empty marks end of stream)
+      @ Out, _put, bool, False if a stop was signaled before the chunk was accepted
+    """
+    while not self._stop.is_set():
+      try:
+        self._queue.put(chunk, timeout=0.1)
+        return True
+      except queue.Full:
+        pass
+    return False
+
+  def _fill(self):
+    """
+      Appends the next prefetched chunk to the pending buffer; re-raises any disk error
+      encountered by the reader thread.
+      @ In, None
+      @ Out, _fill, bool, False if the end of the file has been reached
+    """
+    if self._eof:
+      return False
+    chunk = self._queue.get()
+    if not chunk:
+      self._eof = True
+      if self._error is not None:
+        raise self._error
+      return False
+    self._pending += chunk
+    return True
+
+  def read(self, size=-1):
+    """
+      Reads bytes from the prefetch buffer, blocking on the reader thread as needed.
+      @ In, size, int, optional, number of bytes to read (all remaining if negative)
+      @ Out, data, bytes, the bytes read
+    """
+    if size is None or size < 0:
+      while self._fill():
+        pass
+      size = len(self._pending)
+    else:
+      while len(self._pending) < size and self._fill():
+        pass
+      size = min(size, len(self._pending))
+    data = bytes(self._pending[:size])
+    del self._pending[:size]
+    return data
+
+  def readline(self):
+    """
+      Reads through the next newline; required by the unpickler interface.
+      @ In, None
+      @ Out, line, bytes, the line read (including the newline, if present)
+    """
+    while True:
+      index = self._pending.find(b'\n')
+      if index >= 0 or not self._fill():
+        break
+    index = self._pending.find(b'\n')
+    end = len(self._pending) if index < 0 else index + 1
+    line = bytes(self._pending[:end])
+    del self._pending[:end]
+    return line
+
+  def close(self):
+    """
+      Stops the reader thread and closes the file.  Remaining file contents are
+      discarded, not buffered, so bailing out early on a huge file costs nothing.
+      @ In, None
+      @ Out, None
+    """
+    self._stop.set()
+    # discard queued chunks until the reader notices the stop and exits
+    while self._thread.is_alive():
+      try:
+        self._queue.get_nowait()
+      except queue.Empty:
+        pass
+      self._thread.join(timeout=0.05)
+    self._file.close()
+
+  def __enter__(self):
+    """
+      Context manager entry.
+      @ In, None
+      @ Out, self, _PrefetchReader, this reader
+    """
+    return self
+
+  def __exit__(self, *args):
+    """
+      Context manager exit; releases the reader thread and file handle.
+      @ In, args, list, exception information, if any
+      @ Out, None
+    """
+    self.close()
+
+def _rehydrateFromPath(path):
+  """
+    Reconstructs a ROM on the receiving side of a cross-process transfer by reloading
+    it from its source file instead of from an in-band pickle of the full payload.
+    Loads are cached per process, keyed on path and modification time, so several ROMs
+    sharing a file only pay for deserialization once per worker.  The cached entity
+    itself is never handed out: pickle applies each unpickle's state onto the object
+    returned here, and copy.copy/deepcopy route through __reduce_ex__ as well, so
+    sharing one instance would alias distinct ROM entities onto the same object.  Each
+    call gets a private deep copy of the pristine cached payload instead.
+    @ In, path, str, path of the serialized ROM file
+    @ Out, rom, object, a fresh copy of the reloaded ROM
+  """
+  pristine = _cachedLoadFromPath(path, os.path.getmtime(path))
+  # suspend transport-by-path on the cached original while copying, so the deep copy
+  # is a real copy rather than another trip through this function
+  sourcePath = getattr(pristine, '_sourcePath', None)
+  if sourcePath is not None:
+    pristine._sourcePath = None
+  try:
+    rom = copy.deepcopy(pristine)
+  finally:
+    if sourcePath is not None:
+      pristine._sourcePath = sourcePath
+  return rom
+
+@functools.lru_cache(maxsize=8)
+def _cachedLoadFromPath(path, mtime):
+  """
+    Process-local cache behind _rehydrateFromPath; mtime participates in the key only
+    to invalidate stale entries when the file is rewritten.
+    @ In, path, str, path of the serialized ROM file
+    @ In, mtime, float, modification time of the file when the load was requested
+    @ Out, _cachedLoadFromPath, object, the reloaded ROM
+  """
+  return pickledROM.loadFromFile(path)
+
+class _LazySubROM:
+  """
+    Stand-in for one sub-ROM of a Clustered/Segmented ROM collection that keeps the
+    sub-ROM as a pickle blob and defers unpickling until the sub-ROM is actually used.
+    Attribute access (e.g. the cluster lookup in the collection's evaluate path)
+    transparently materializes the wrapped ROM; clusters that are never evaluated stay
+    as compressed bytes, so load time and memory scale with the clusters consumed
+    rather than the clusters stored.
+  """
+  def __init__(self, blob):
+    """
+      Constructor.
+      @ In, blob, bytes, pickled representation of the wrapped sub-ROM
+      @ Out, None
+    """
+    self._blob = blob
+    self._rom = None
+    self._pendingParams = []
+
+  def _materialize(self):
+    """
+      Unpickles the wrapped sub-ROM on first use, applies any deferred parameters, and
+      caches the result.
+      @ In, None
+      @ Out, _materialize, object, the wrapped sub-ROM
+    """
+    if self._rom is None:
+      self._rom = pickle.loads(self._blob)
+      self._blob = None
+      for params in self._pendingParams:
+        self._rom.setAdditionalParams(params)
+      self._pendingParams = []
+    return self._rom
+
+  def setAdditionalParams(self, params):
+    """
+      Stores (or passes through) additional parameters for the wrapped sub-ROM.  The
+      collection broadcasts these to every sub-ROM right after an IOStep load; applying
+      them lazily on first real use keeps the broadcast from materializing everything.
+      @ In, params, dict, parameters to set, dependent on ROM
+      @ Out, None
+    """
+    if self._rom is not None:
+      self._rom.setAdditionalParams(params)
+    else:
+      self._pendingParams.append(params)
+
+  def __getattr__(self, name):
+    """
+      Forwards attribute access to the wrapped sub-ROM, unpickling it on first touch.
+      Only reached for names not defined on the wrapper itself.
+      @ In, name, str, attribute name
+      @ Out, __getattr__, object, the requested attribute of the sub-ROM
+    """
+    if name.startswith('__') and name.endswith('__'):
+      # don't let protocol probes (copy, pickle, etc.) force materialization
+      raise AttributeError(name)
+    return getattr(self._materialize(), name)
+
+  def __reduce__(self):
+    """
+      Pickles the wrapper as its blob so laziness survives round trips to disk.
+      @ In, None
+      @ Out, __reduce__, tuple, (callable, args[, state]) reconstruction pair
+    """
+    blob = self._blob
+    if blob is None:
+      blob = pickle.dumps(self._rom, protocol=pickle.HIGHEST_PROTOCOL)
+    if self._pendingParams:
+      return (_LazySubROM, (blob,), {'_pendingParams': list(self._pendingParams)})
+    return (_LazySubROM, (blob,))
+
+def _collectSubROMs(rom):
+  """
+    Collects the individual sub-ROMs of any Clustered/Segmented ROM collections
+    reachable from a ROM or ROM-containing model: the "_roms" container (list or array),
+    the per-label cluster map including the unclustered leftovers, and the nested
+    per-macro-step collections of an Interpolated ROM.  Results are deduplicated by
+    identity, since the cluster map aliases members of "_roms".
+    @ In, rom, object, ROM (or model holding a supervisedContainer of ROMs)
+    @ Out, subROMs, list, sub-ROM instances eligible for lazy wrapping
+  """
+  engines = list(getattr(rom, 'supervisedContainer', None) or [rom])
+  # Interpolated collections nest one collection per macro step (e.g. per year)
+  for engine in list(engines):
+    macroSteps = getattr(engine, '_macroSteps', None)
+    if isinstance(macroSteps, dict):
+      engines.extend(macroSteps.values())
+  subROMs = []
+  seen = set()
+  for engine in engines:
+    candidates = []
+    roms = getattr(engine, '_roms', None)
+    if roms is not None:
+      candidates.extend(roms)
+    clusterInfo = getattr(engine, '_clusterInfo', None)
+    if isinstance(clusterInfo, dict):
+      for group in clusterInfo.get('map', {}).values():
+        candidates.extend(group)
+    for sub in candidates:
+      # the 'first' evaluation mode stores plain indices in the cluster map; only wrap
+      # actual ROMs, and leave already-lazy wrappers alone
+      if isinstance(sub, _LazySubROM) or not callable(getattr(sub, 'evaluate', None)):
+        continue
+      if id(sub) not in seen:
+        seen.add(id(sub))
+        subROMs.append(sub)
+  return subROMs
+
+def save(path, rom, outOfBand=False):
+  """
+    Serializes a trained ROM to file using pickle protocol 5.  By default the file is
+    fully self-contained and loadable with plain "pickle.load", the format every
+    existing consumer of RAVEN ROM files expects.  With "outOfBand" enabled, large
+    buffers exposed by the ROM's contents (e.g. the NumPy arrays inside ARMA/VARMA
+    state) are instead written length-prefixed to a companion "<path>.buf" file, so
+    "loadFromFile" can hand them back to the unpickler without copying them through
+    the pickle stream; such a file requires "loadFromFile" (with the sidecar present)
+    to deserialize.
+    @ In, path, str, path of the file to write
+    @ In, rom, object, trained ROM (or ROM-containing model) to serialize
+    @ In, outOfBand, bool, optional, True to route large array buffers to the sidecar
+    @ Out, None
+  """
+  # NOTE stick to the C _pickle entry points and never subclass Pickler/Unpickler in
+  # Python here: subclassing silently drops to the pure-Python implementation.  Per-type
+  # hooks go through the pickler's dispatch_table instead, as below.
+  buffers = []
+  def bufferCallback(buf):
+    """
+      Decides, per exposed buffer, between the in-band and out-of-band paths.
+      @ In, buf, pickle.PickleBuffer, buffer exposed by the object being pickled
+      @ Out, inline, bool, True to serialize the buffer inside the pickle stream
+    """
+    if buf.raw().nbytes < _BUFFER_INLINE_THRESHOLD:
+      return True
+    buffers.append(buf)
+    return False
+  stream = io.BytesIO()
+  pickler = pickle.Pickler(stream, protocol=pickle.HIGHEST_PROTOCOL,
+                           buffer_callback=bufferCallback if outOfBand else None)
+  subROMs = _collectSubROMs(rom)
+  if subROMs:
+    # reduce the identified sub-ROMs to lazy wrappers *through the pickler*, so every
+    # alias of a sub-ROM (the _roms container, the per-label cluster map, the
+    # unclustered leftovers) resolves to one shared wrapper via the pickle memo;
+    # identity-based lookups between those containers keep working after reload
+    targetIds = set(map(id, subROMs))
+    def reduceSubROM(sub):
+      """
+        Reducer installed for the sub-ROM classes; wraps collection members as lazy
+        blobs and pickles any other instance of the same class normally.
+        @ In, sub, object, instance being pickled
+        @ Out, reduceSubROM, tuple, pickle reduction pair
+      """
+      if id(sub) in targetIds:
+        blob = pickletools.optimize(pickle.dumps(sub, protocol=pickle.HIGHEST_PROTOCOL))
+        return (_LazySubROM, (blob,))
+      return sub.__reduce_ex__(pickle.HIGHEST_PROTOCOL)
+    dispatch = copyreg.dispatch_table.copy()
+    for klass in set(map(type, subROMs)):
+      dispatch[klass] = reduceSubROM
+    pickler.dispatch_table = dispatch
+  # suspend transport-by-path (Models.ROM.__reduce_ex__) while writing: a persisted
+  # file must carry the full payload, not a pointer back to another file
+  sourcePath = getattr(rom, '_sourcePath', None)
+  if sourcePath is not None:
+    rom._sourcePath = None
+  try:
+    try:
+      pickler.dump(rom)
+    except (pickle.PicklingError, TypeError, AttributeError):
+      # some payloads are only serializable by cloudpickle, which the IOStep
+      # historically used: dynamically defined classes, and local functions/closures
+      # (for which CPython raises AttributeError, not PicklingError); fall back to a
+      # fully in-band cloudpickle dump so nothing previously writable is rejected
+      import cloudpickle
+      stream = io.BytesIO()
+      buffers.clear()
+      cloudpickle.dump(rom, stream, protocol=pickle.HIGHEST_PROTOCOL)
+  finally:
+    if sourcePath is not None:
+      rom._sourcePath = sourcePath
+  # a ROM file is written once and loaded many times: strip the memo PUT opcodes the
+  # pickler emits for objects that are never referenced again, which shrinks the file
+  # and keeps the unpickler's memo small during every subsequent load
+  blob = pickletools.optimize(stream.getvalue())
+  with open(path, 'wb') as f:
+    f.write(blob)
+  sidecar = _sidecarPath(path)
+  if buffers:
+    with open(sidecar, 'wb') as side:
+      for buf in buffers:
+        raw = buf.raw()
+        side.write(len(raw).to_bytes(8, 'little'))
+        side.write(raw)
+  elif os.path.isfile(sidecar):
+    # don't leave a stale sidecar from a previous serialization of the same file
+    os.remove(sidecar)
 
 class pickledROM(SupervisedLearning):
   """
     Placeholder for ROMs that will be generated by unpickling from file.
   """
+  # built once; raised directly on the (hot) unloaded path without MessageHandler dispatch
+  _NOT_LOADED_ERR = 'PickledROM has not been loaded from file yet!  An IO step is required to perform this action.'
   @classmethod
   def getInputSpecification(cls):
     """
@@ -34,6 +526,13 @@ class pickledROM(SupervisedLearning):
       @ Out, inputSpecification, InputData.ParameterInput, class to use for
         specifying input of cls.
     """
+    # the specification is a pure function of the class, but building it allocates a
+    # sizeable InputData tree; cache it on the class so repeated requests (one per ROM
+    # instantiated or XML block validated) reuse the first build.  Note we check
+    # cls.__dict__ instead of using getattr so subclasses do not pick up a parent's cache.
+    cached = cls.__dict__.get('_cachedInputSpec')
+    if cached is not None:
+      return cached
     specs = super().getInputSpecification()
     specs.description = r"""It is not uncommon for a reduced-order model (ROM) to be created and trained in one RAVEN run, then
     serialized to file (\emph{pickled}), then loaded into another RAVEN run to be used as a model.  When this is
@@ -56,59 +555,91 @@ class pickledROM(SupervisedLearning):
                                                  descr=r"""provides seed for VARMA and ARMA sampling.
                                                   Must be provided before training. If no seed is assigned,
                                                   then a random number will be used.""", default=None))
-    multicycle = InputData.parameterInputFactory("Multicycle", contentType=InputTypes.StringType,
-                                                 descr=r"""indicates that each sample of the ARMA should yield
-                                                   multiple sequential samples. For example, if an ARMA model is trained to produce a year's worth of data,
-                                                   enabling \xmlNode{Multicycle} causes it to produce several successive years of data. Multicycle sampling
-                                                   is independent of ROM training, and only changes how samples of the ARMA are created.
-                                                   \nb The output of a multicycle ARMA must be stored in a \xmlNode{DataSet}, as the targets will depend
-                                                   on both the \xmlNode{pivotParameter} as well as the cycle, \xmlString{Cycle}. The cycle is a second
-                                                   \xmlNode{Index} that all targets should depend on, with variable name \xmlString{Cycle}.""", default=None)
-    multicycle.addSub(InputData.parameterInputFactory("cycles", contentType=InputTypes.IntegerType,
-                                                 descr=r"""the number of cycles the ARMA should produce
-                                                   each time it yields a sample.""", default='no-default'))
-    growth = InputData.parameterInputFactory("growth", contentType=InputTypes.FloatType,
-                                                 descr=r"""if provided then the histories produced by
-                                                   the ARMA will be increased by the growth factor for successive cycles. This node can be added
-                                                   multiple times with different settings for different targets.
-                                                   The text of this node is the growth factor in percentage. Some examples are in
-                                                   Table~\ref{tab:arma multicycle growth}, where \emph{Growth factor} is the value used in the RAVEN
-                                                   input and \emph{Scaling factor} is the value by which the history will be multiplied.
-                                                   \begin{table}[h!]
-                                                     \centering
-                                                     \begin{tabular}{r c l}
-                                                       Growth factor & Scaling factor & Description \\ \hline
-                                                       50 & 1.5 & growing by 50\% each cycle \\
-                                                       -50 & 0.5 & shrinking by 50\% each cycle \\
-                                                       150 & 2.5 & growing by 150\% each cycle \\
-                                                     \end{tabular}
-                                                     \caption{ARMA Growth Factor Examples}
-                                                     \label{tab:arma multicycle growth}
-                                                   \end{table}""", default=None)
-    growth.addParam("targets", InputTypes.StringListType, required=True,
-                  descr=r"""lists the targets
-                    in this ARMA that this growth factor should apply to.""")
-    growth.addParam('start_index', InputTypes.IntegerType)
-    growth.addParam('end_index', InputTypes.IntegerType)
-    growthEnumType = InputTypes.makeEnumType('growth', 'armaGrowthType', ['exponential', 'linear'])
-    growth.addParam("mode", growthEnumType, required=True,
-                  descr=r"""either \xmlString{linear} or
-                    \xmlString{exponential}, determines the manner in which the growth factor is applied.
-                    If \xmlString{linear}, then the scaling factor is $(1+y\cdot g/100)$;
-                    if \xmlString{exponential}, then the scaling factor is $(1+g/100)^y$;
-                    where $y$ is the cycle after the first and $g$ is the provided scaling factor.""")
-    multicycle.addSub(growth)
-    specs.addSub(multicycle)
-    clusterEvalModeEnum = InputTypes.makeEnumType('clusterEvalModeEnum', 'clusterEvalModeType', ['clustered', 'truncated', 'full'])
+    specs.addSub(_buildMulticycleSpec())
     # for pickled Interpolated ROMCollection
-    specs.addSub(InputData.parameterInputFactory('clusterEvalMode', contentType=clusterEvalModeEnum,
+    specs.addSub(InputData.parameterInputFactory('clusterEvalMode', contentType=_CLUSTER_EVAL_ENUM,
                                                  descr=r"""changes the structure of the samples for Clustered
                                                  Segmented ROMs. These are identical to the options for \xmlNode{evalMode}
                                                  node under \xmlNode{Segmented} """, default=None))
     specs.addSub(InputData.parameterInputFactory('maxCycles', contentType=InputTypes.IntegerType,
                                                  descr=r"""maximum number of cycles to run (default no limit)""", default=None))
+    cls._cachedInputSpec = specs
     return specs
 
+  # modules the common ROM backends import lazily (ARMA pulls in statsmodels and
+  # sklearn at evaluation time); importing them up front keeps the first unpickle from
+  # paying for module initialization
+  _WARMUP_MODULES = ('numpy',
+                     'scipy.stats',
+                     'sklearn.linear_model',
+                     'statsmodels.api',
+                     'ravenframework.SupervisedLearning.ARMA',
+                     'ravenframework.SupervisedLearning.ROMCollection')
+  _warmedUp = False
+
+  @classmethod
+  def warmup(cls):
+    """
+      Eagerly imports the module graph that serialized ROM payloads commonly reference,
+      so the GLOBAL opcodes of the first unpickle resolve from already-cached
+      sys.modules entries instead of charging import time to whichever Step first
+      touches the ROM.  Runs once per process; modules missing from the installation
+      are skipped.
+      @ In, None
+      @ Out, None
+    """
+    if cls._warmedUp:
+      return
+    for name in cls._WARMUP_MODULES:
+      try:
+        importlib.import_module(name)
+      except ImportError:
+        pass
+    cls._warmedUp = True
+
+  @classmethod
+  def loadFromFile(cls, path):
+    """
+      Deserializes a ROM previously written by "save" (or by plain pickling, e.g. an
+      IOStep MODEL-FILES action).  If a companion "<path>.buf" file exists, the embedded
+      array buffers are supplied out-of-band from a memory map of that file, avoiding an
+      array-sized copy per NumPy payload during the load.
+      @ In, path, str, path of the serialized ROM file
+      @ Out, rom, object, the deserialized ROM
+    """
+    sidecar = _sidecarPath(path)
+    buffers = _iterBuffers(sidecar) if os.path.isfile(sidecar) else None
+    # unpickling allocates millions of small container objects, and each allocation
+    # nudges the generational collector closer to a (useless) collection pass; turning
+    # the collector off for the duration is worth ~20% on large ROMs
+    wasEnabled = gc.isenabled()
+    gc.disable()
+    try:
+      # the prefetch reader keeps the disk busy while the unpickler decodes, hiding the
+      # I/O half of the wall time for large files
+      try:
+        with _PrefetchReader(path) as f:
+          rom = pickle.Unpickler(f, buffers=buffers).load()
+      except pickle.UnpicklingError as err:
+        if buffers is None and 'out-of-band' in str(err):
+          # the stream was written by "save(..., outOfBand=True)" but the sidecar did
+          # not travel with it; the stock pickle error here is too obscure to act on
+          raise IOError('The serialized ROM "' + str(path) + '" references out-of-band buffers, but its companion '
+                        'buffer file "' + str(sidecar) + '" has not been found! It must be kept alongside the ROM file.') from err
+        raise
+    finally:
+      if wasEnabled:
+        gc.enable()
+        # reclaim any cycles created while the collector was off
+        gc.collect()
+    # remember where the ROM came from, so objects supporting transport-by-path (see
+    # Models.ROM.__reduce_ex__) re-pickle as just the path when shipped to workers
+    try:
+      rom._sourcePath = path
+    except AttributeError:
+      pass
+    return rom
+
   def __init__(self):
     """
       A constructor that will appropriately intialize a supervised learning object
@@ -121,6 +652,10 @@ class pickledROM(SupervisedLearning):
     self.initOptionDict = {}
     self.features = ['PlaceHolder']
     self.target = 'PlaceHolder'
+    # a pickledROM in the input guarantees an unpickle is coming; start the backend
+    # imports now (entity construction, well before the IOStep load) while keeping
+    # them lazy for runs that never touch a pickled ROM
+    self.warmup()
 
   def __confidenceLocal__(self,featureVals):
     """
@@ -161,7 +696,9 @@ class pickledROM(SupervisedLearning):
       @ In, featureVals, list, of values at which to evaluate the ROM
       @ Out, returnDict, dict, the evaluated point for each target
     """
-    self.raiseAnError(RuntimeError, 'PickledROM has not been loaded from file yet!  An IO step is required to perform this action.')
+    # this can be probed in tight loops (e.g. feasibility pre-checks); raise directly
+    # rather than paying for raiseAnError's formatting and handler dispatch each time
+    raise RuntimeError(self._NOT_LOADED_ERR)
 
   def _train(self,featureVals,targetVals):
     """
@@ -169,4 +706,4 @@ class pickledROM(SupervisedLearning):
       @ In, featureVals, np.ndarray, feature values
       @ In, targetVals, np.ndarray, target values
     """
-    self.raiseAnError(RuntimeError, 'PickledROM has not been loaded from file yet!  An IO step is required to perform this action.')
+    raise RuntimeError(self._NOT_LOADED_ERR)
@@ -67,8 +67,17 @@ class FMUexporter(MessageUser):
     # we serialize the model and this model will be stored in the resource folder
     self.serializedModel = Path(self._temp) / (self.model.name + ".pk")
     # picklefile in temp directory
-    with open(self.serializedModel, mode="wb+") as pk:
-      cloudpickle.dump(self.model, pk, protocol=pickle.HIGHEST_PROTOCOL)
+    # suspend transport-by-path for loaded ROMs (Models.ROM.__reduce_ex__): the FMU
+    # payload must be self-contained and portable
+    sourcePath = getattr(self.model, '_sourcePath', None)
+    if sourcePath is not None:
+      self.model._sourcePath = None
+    try:
+      with open(self.serializedModel, mode="wb+") as pk:
+        cloudpickle.dump(self.model, pk, protocol=pickle.HIGHEST_PROTOCOL)
+    finally:
+      if sourcePath is not None:
+        self.model._sourcePath = sourcePath
     self.executeMethod = self._options.pop("executeMethod", None)
     if self.executeMethod is None:
       self.raiseAnError(IOError, "No executeMethod has been provided for FMU exporter!")
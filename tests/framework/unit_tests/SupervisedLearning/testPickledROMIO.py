@@ -0,0 +1,227 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the pickledROM serialization helpers
+  (save, loadFromFile, and the lazy sub-ROM wrapping for collections).
+  It can not be considered part of the active code but of the regression test system
+"""
+import sys, os
+import pickle as pk
+import tempfile
+import numpy as np
+
+# find location of the framework
+ravenDir = os.path.abspath(os.path.join(*([os.path.dirname(__file__)]+[os.pardir]*4)))
+sys.path.append(ravenDir)
+
+from ravenframework.SupervisedLearning import pickledROM as pr
+
+print('Module undergoing testing:')
+print(pr)
+print('')
+
+results = {"pass":0,"fail":0}
+
+def checkTrue(comment,value,update=True):
+  """
+    This method is aimed to check if a boolean is true
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, bool, the value to check
+    @ In, update, bool, optional, if False then don't update results counter
+    @ Out, value, bool, True if true
+  """
+  if update:
+    if value:
+      results["pass"] += 1
+    else:
+      results["fail"] += 1
+      print("checking",comment,'|',value,'is not True!')
+  return value
+
+def checkSame(comment,value,expected,update=True):
+  """
+    This method is aimed to compare two identical things
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ In, update, bool, optional, if False then don't update results counter
+    @ Out, res, bool, True if same
+  """
+  res = value == expected
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      results["fail"] += 1
+      print("checking",comment,'|',value,"!=",expected)
+  return res
+
+class FakeSubROM(object):
+  """
+    Stand-in for a trained SupervisedLearning engine inside a ROMCollection,
+    exposing just the surface the lazy wrapper interacts with.
+  """
+  def __init__(self, tag):
+    """
+      Constructor.
+      @ In, tag, int, identifier for this sub-ROM
+      @ Out, None
+    """
+    self.tag = tag
+    self.appliedParams = []
+
+  def evaluate(self, request):
+    """
+      Dummy evaluation.
+      @ In, request, dict, evaluation request
+      @ Out, evaluate, int, the sub-ROM tag
+    """
+    return self.tag
+
+  def setAdditionalParams(self, params):
+    """
+      Record applied params so deferral can be checked.
+      @ In, params, dict, parameters to apply
+      @ Out, None
+    """
+    self.appliedParams.append(params)
+
+class FakeCollection(object):
+  """
+    Stand-in for a Clusters-style collection: sub-ROMs live in _roms (as an
+    ndarray, matching Segments._trainBySegments) and are aliased from the
+    cluster map, including the 'unclustered' entry.
+  """
+  def __init__(self, roms, unclustered):
+    """
+      Constructor.
+      @ In, roms, list, FakeSubROM instances for the clustered segments
+      @ In, unclustered, list, FakeSubROM instances left out of clustering
+      @ Out, None
+    """
+    self._roms = np.asarray(roms, dtype=object)
+    self._clusterInfo = {'map': {0: [roms[0], roms[1]],
+                                 1: [roms[2]],
+                                 'unclustered': list(unclustered)}}
+
+tempDir = tempfile.mkdtemp()
+
+#############################################
+# default save is self-contained plain pickle #
+#############################################
+bigPath = os.path.join(tempDir, 'big.pk')
+bigArray = np.arange(1 << 18, dtype=np.float64) # 2 MB, above the inline threshold
+pr.save(bigPath, {'data': bigArray, 'label': 'big'})
+checkTrue('no sidecar by default', not os.path.isfile(pr._sidecarPath(bigPath)))
+# downstream consumers (externalROMloader, user scripts) load with stock pickle
+with open(bigPath, 'rb') as f:
+  loaded = pk.load(f)
+checkTrue('default file loads with plain pickle', np.array_equal(loaded['data'], bigArray))
+loaded = pr.pickledROM.loadFromFile(bigPath)
+checkTrue('default file loads with loadFromFile', np.array_equal(loaded['data'], bigArray))
+
+######################################
+# round trip with out-of-band sidecar #
+######################################
+pr.save(bigPath, {'data': bigArray, 'label': 'big'}, outOfBand=True)
+checkTrue('sidecar written for large arrays', os.path.isfile(pr._sidecarPath(bigPath)))
+checkTrue('main file excludes large buffers', os.path.getsize(bigPath) < bigArray.nbytes)
+loaded = pr.pickledROM.loadFromFile(bigPath)
+checkSame('large payload label', loaded['label'], 'big')
+checkTrue('large array round trip', np.array_equal(loaded['data'], bigArray))
+# out-of-band buffers must come back writable (ACCESS_COPY mapping)
+loaded['data'][0] = -1.0
+checkSame('reloaded array is writable', loaded['data'][0], -1.0)
+
+#########################################
+# missing sidecar gives an actionable error #
+#########################################
+os.rename(pr._sidecarPath(bigPath), pr._sidecarPath(bigPath) + '.bak')
+try:
+  pr.pickledROM.loadFromFile(bigPath)
+  checkTrue('missing sidecar raises', False)
+except IOError as err:
+  checkTrue('missing sidecar error names the buffer file', pr._sidecarPath(bigPath) in str(err))
+os.rename(pr._sidecarPath(bigPath) + '.bak', pr._sidecarPath(bigPath))
+
+###############################
+# round trip without sidecar  #
+###############################
+smallPath = os.path.join(tempDir, 'small.pk')
+smallArray = np.arange(8, dtype=np.float64)
+pr.save(smallPath, {'data': smallArray}, outOfBand=True)
+checkTrue('no sidecar for small payloads', not os.path.isfile(pr._sidecarPath(smallPath)))
+loaded = pr.pickledROM.loadFromFile(smallPath)
+checkTrue('small array round trip', np.array_equal(loaded['data'], smallArray))
+
+###########################
+# stale sidecar is removed #
+###########################
+pr.save(bigPath, {'data': smallArray})
+checkTrue('stale sidecar removed on rewrite', not os.path.isfile(pr._sidecarPath(bigPath)))
+loaded = pr.pickledROM.loadFromFile(bigPath)
+checkTrue('rewrite round trip', np.array_equal(loaded['data'], smallArray))
+
+#####################################
+# legacy plain-pickle files still load #
+#####################################
+legacyPath = os.path.join(tempDir, 'legacy.pk')
+with open(legacyPath, 'wb') as f:
+  pk.dump({'data': bigArray}, f)
+loaded = pr.pickledROM.loadFromFile(legacyPath)
+checkTrue('legacy pickle loads', np.array_equal(loaded['data'], bigArray))
+
+#################################
+# lazy sub-ROM collection wrapping #
+#################################
+roms = [FakeSubROM(i) for i in range(3)]
+unclustered = [FakeSubROM(99)]
+collection = FakeCollection(roms, unclustered)
+lazyPath = os.path.join(tempDir, 'lazy.pk')
+pr.save(lazyPath, collection)
+# the live object must be untouched by saving
+checkTrue('live sub-ROMs not wrapped', all(isinstance(r, FakeSubROM) for r in collection._roms))
+loaded = pr.pickledROM.loadFromFile(lazyPath)
+checkTrue('sub-ROMs reload as lazy stubs', all(isinstance(r, pr._LazySubROM) for r in loaded._roms))
+checkTrue('unclustered alias is lazy too', isinstance(loaded._clusterInfo['map']['unclustered'][0], pr._LazySubROM))
+# aliasing between _roms and the cluster map must survive the round trip
+checkTrue('cluster map alias identity 0', loaded._clusterInfo['map'][0][0] is loaded._roms[0])
+checkTrue('cluster map alias identity 1', loaded._clusterInfo['map'][0][1] is loaded._roms[1])
+checkTrue('cluster map alias identity 2', loaded._clusterInfo['map'][1][0] is loaded._roms[2])
+# params set before materialization are deferred, not applied
+loaded._roms[1].setAdditionalParams({'seed': 42})
+checkTrue('params deferred until materialization', loaded._roms[1]._rom is None)
+# touching one sub-ROM materializes it (with deferred params) and only it
+checkSame('lazy sub-ROM evaluation', loaded._roms[1].evaluate({}), 1)
+checkTrue('touched sub-ROM materialized', loaded._roms[1]._rom is not None)
+checkSame('deferred params applied', loaded._roms[1]._rom.appliedParams, [{'seed': 42}])
+checkTrue('untouched sub-ROMs stay lazy', loaded._roms[0]._rom is None and loaded._roms[2]._rom is None)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.test_pickled_rom_io</name>
+    <author>talbpaul</author>
+    <created>2026-08-26</created>
+    <classesTested>SupervisedLearning.pickledROM</classesTested>
+    <description>
+       This test is a Unit Test for the pickledROM serialization helpers:
+       the self-contained default output of save, the opt-in out-of-band
+       buffer sidecar, the loadFromFile reader, legacy pickle compatibility,
+       and the lazy sub-ROM wrapping applied to ROM collections.
+    </description>
+  </TestInfo>
+"""